@@ -1,22 +1,38 @@
 import gradio as gr
 from groq import Groq
 import json
+import logging
 import os
+import threading
+import time
 
+logger = logging.getLogger("trip_planner")
+
+# The SDK also honours GROQ_BASE_URL, which the load-test harness points at a fake server.
 client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
-DB = "database.json"
+DB = os.getenv("TRIP_PLANNER_DB", "database.json")
+
+# Queue tuning: concurrent plan_trip workers, pending-request cap (0 = unbounded)
+# and the server's thread pool size.
+QUEUE_CONCURRENCY = int(os.getenv("TRIP_PLANNER_CONCURRENCY", "4"))
+QUEUE_MAX_SIZE = int(os.getenv("TRIP_PLANNER_MAX_QUEUE", "64")) or None
+MAX_THREADS = int(os.getenv("TRIP_PLANNER_MAX_THREADS", "40"))
+
+# save_to_db is a read-modify-write of one JSON file; serialize it across workers.
+db_lock = threading.Lock()
 
 if not os.path.exists(DB):
     with open(DB, "w") as f:
         json.dump([], f)
 
 def save_to_db(city, days, budget, plan):
-    with open(DB, "r") as f:
-        data = json.load(f)
-    data.append({"city": city, "days": days, "budget": budget, "plan": plan})
-    with open(DB, "w") as f:
-        json.dump(data, f, indent=4)
+    with db_lock:
+        with open(DB, "r") as f:
+            data = json.load(f)
+        data.append({"city": city, "days": days, "budget": budget, "plan": plan})
+        with open(DB, "w") as f:
+            json.dump(data, f, indent=4)
 
 pakistan_cities = [
     "Islamabad", "Lahore", "Karachi", "Multan", "Quetta", "Peshawar",
@@ -24,11 +40,18 @@ pakistan_cities = [
     "Swat", "Gilgit", "Hyderabad"
 ]
 
-def plan_trip(city, days, budget):
+def plan_trip_timed(city, days, budget):
+    """Plan a trip and return ``(plan, spans, outcome)``.
+
+    ``spans`` holds per-phase seconds, including the phase that failed.
+    ``outcome`` is ``ok``, ``invalid``, ``llm_error`` or ``db_error``.
+    """
+    spans = {}
 
     if not city or not days or not budget:
-        return "❌ Please fill all fields."
+        return "❌ Please fill all fields.", spans, "invalid"
 
+    started = time.perf_counter()
     prompt = f"""
     Create a detailed trip plan with:
     - Best attractions
@@ -40,18 +63,39 @@ def plan_trip(city, days, budget):
     Days: {days}
     Budget: {budget} PKR
     """
+    spans["prompt"] = time.perf_counter() - started
 
+    outcome = "llm_error"
     try:
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}]
-        )
-        plan = response.choices[0].message.content
-        save_to_db(city, days, budget, plan)
-        return plan
+        started = time.perf_counter()
+        try:
+            response = client.chat.completions.create(
+                model="llama-3.3-70b-versatile",
+                messages=[{"role": "user", "content": prompt}]
+            )
+            plan = response.choices[0].message.content
+        finally:
+            spans["llm"] = time.perf_counter() - started
+
+        outcome = "db_error"
+        started = time.perf_counter()
+        try:
+            save_to_db(city, days, budget, plan)
+        finally:
+            spans["save_to_db"] = time.perf_counter() - started
+        return plan, spans, "ok"
 
     except Exception as e:
-        return f"❌ Error: {str(e)}"
+        return f"❌ Error: {str(e)}", spans, outcome
+
+def plan_trip(city, days, budget):
+    plan, spans, outcome = plan_trip_timed(city, days, budget)
+    logger.info(
+        "plan_trip outcome=%s %s",
+        outcome,
+        " ".join(f"{name}={seconds * 1000:.3f}ms" for name, seconds in spans.items()),
+    )
+    return plan
 
 
 css = """
@@ -83,6 +127,10 @@ with gr.Blocks(css=css, theme=gr.themes.Soft(primary_hue="pink")) as demo:
         btn = gr.Button("✨ Generate Travel Plan")
         out = gr.Textbox(lines=20, label="📘 Trip Plan")
 
-        btn.click(plan_trip, [city, days, budget], out)
+        btn.click(plan_trip, [city, days, budget], out, concurrency_limit=QUEUE_CONCURRENCY)
+
+demo.queue(default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_MAX_SIZE)
 
-demo.launch()
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    demo.launch(max_threads=MAX_THREADS)
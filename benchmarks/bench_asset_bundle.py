@@ -0,0 +1,93 @@
+"""Compare the per-file scene layout with a packed asset bundle.
+
+Usage::
+
+    python -m benchmarks.bench_asset_bundle --scenes 5000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from src.services.asset_bundle import BundleReader, split_ref
+from src.services.image_generator import ImageGenerator
+from src.services.scene_planner import Scene
+
+
+def _scenes(count: int) -> List[Scene]:
+    return [
+        Scene(
+            index=idx,
+            start_time=idx,
+            end_time=idx + 1,
+            visuals=f"Scene {idx}: benchmark visuals",
+            narration=f"Narration {idx}",
+        )
+        for idx in range(1, count + 1)
+    ]
+
+
+def _timed(func: Callable[[], object]) -> Tuple[float, object]:
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def _read_files(images: Dict[int, str]) -> Tuple[int, int]:
+    total = checksum = 0
+    for path in images.values():
+        data = Path(path).read_bytes()
+        total += len(data)
+        checksum = zlib.crc32(data, checksum)
+    return total, checksum
+
+
+def _read_bundle(images: Dict[int, str]) -> Tuple[int, int]:
+    bundle_path, _ = split_ref(next(iter(images.values())))
+    total = checksum = 0
+    with BundleReader(bundle_path) as reader:
+        for ref in images.values():
+            with reader.get(split_ref(ref)[1]) as view:
+                total += len(view)
+                checksum = zlib.crc32(view, checksum)
+    return total, checksum
+
+
+def run(scene_count: int) -> None:
+    """Time both layouts with a warm page cache.
+
+    Each read pass touches every byte (CRC32 over the data). One untimed pass
+    warms the cache first so both layouts are measured in the same state; the
+    byte totals and checksums must match between the two rows.
+    """
+    scenes = _scenes(scene_count)
+    print(
+        f"{'layout':<10}{'files':>8}{'write s':>10}{'list s':>10}{'read s':>10}"
+        f"{'bytes':>12}{'crc32':>10}"
+    )
+    for layout, bundle in (("per-file", False), ("bundle", True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            generator = ImageGenerator(tmp, bundle=bundle)
+            write_s, images = _timed(lambda: generator.generate(scenes))
+            list_s, entries = _timed(lambda: list(generator.images_dir.iterdir()))
+            reader = _read_bundle if bundle else _read_files
+            reader(images)
+            read_s, (total, checksum) = _timed(lambda: reader(images))
+            print(
+                f"{layout:<10}{len(entries):>8}{write_s:>10.4f}{list_s:>10.4f}{read_s:>10.4f}"
+                f"{total:>12}{checksum:>10x}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-file vs bundled scene assets")
+    parser.add_argument("--scenes", type=int, default=2000, help="Number of scenes to generate")
+    run(parser.parse_args().scenes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""Load-test the trip planner through its Gradio queue against a fake Groq endpoint.
+
+For every configuration (queue concurrency x max queue size x server threads)
+the harness launches ``app.py`` in a subprocess with the matching
+``TRIP_PLANNER_*`` settings, pointed at a local fake Groq server. N simulated
+users then drive ``plan_trip`` through ``gradio_client``, each sending
+requests back-to-back. It reports p50/p95/p99 end-to-end latency and
+throughput over successful requests, failed requests (error plans or client
+errors), queue-full rejections and the mean per-phase spans parsed from the
+app's log.
+
+Usage::
+
+    python -m benchmarks.bench_trip_planner --users 32 --concurrency 1 4 8 16
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from gradio_client import Client
+from gradio_client.utils import QueueError
+
+ROOT = Path(__file__).resolve().parents[1]
+_SPAN_PATTERN = re.compile(r"(prompt|llm|save_to_db)=([0-9.]+)ms")
+
+
+def _fake_groq_handler(delay_seconds: float):
+    class FakeGroqHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            time.sleep(delay_seconds)
+            body = json.dumps(
+                {
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", "fake"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "Day 1: explore."},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                }
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return FakeGroqHandler
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = min(len(ordered), max(1, math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _launch_app(env: Dict[str, str], log_path: Path, timeout: float = 60.0):
+    log_file = log_path.open("w")
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / "app.py")],
+        cwd=str(ROOT),
+        env=env,
+        stdout=log_file,
+        stderr=subprocess.STDOUT,
+    )
+    url = f"http://127.0.0.1:{env['GRADIO_SERVER_PORT']}/"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"app.py exited early; see {log_path}")
+        try:
+            urllib.request.urlopen(url, timeout=1).close()
+            return process, log_file, url
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"app.py did not start within {timeout}s; see {log_path}")
+
+
+def _drive(url: str, users: int, requests_per_user: int) -> Dict:
+    # One client thread per user so submissions are never throttled client-side.
+    client = Client(url, verbose=False, max_workers=max(1, users))
+    latencies: List[float] = []
+    errors = rejected = 0
+    lock = threading.Lock()
+
+    def simulate_user(user: int) -> None:
+        nonlocal errors, rejected
+        for attempt in range(requests_per_user):
+            submitted = time.perf_counter()
+            try:
+                plan = client.submit(
+                    "Lahore", str(1 + attempt % 5), str(10000 * (user + 1)),
+                    api_name="/plan_trip",
+                ).result()
+            except QueueError:
+                with lock:
+                    rejected += 1
+                continue
+            except Exception:
+                with lock:
+                    errors += 1
+                continue
+            with lock:
+                if str(plan).startswith("❌"):
+                    errors += 1
+                else:
+                    latencies.append(time.perf_counter() - submitted)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=simulate_user, args=(user,)) for user in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    client.close()
+
+    return {
+        "ok": len(latencies),
+        "errors": errors,
+        "rejected": rejected,
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+    }
+
+
+def _mean_spans(log_text: str) -> Dict[str, float]:
+    spans: Dict[str, List[float]] = {}
+    for name, millis in _SPAN_PATTERN.findall(log_text):
+        spans.setdefault(name, []).append(float(millis))
+    return {name: sum(values) / len(values) for name, values in spans.items()}
+
+
+def run(
+    users: int,
+    requests_per_user: int,
+    concurrency: Sequence[int],
+    max_queue: Sequence[int],
+    max_threads: Sequence[int],
+    llm_delay: float,
+) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _fake_groq_handler(llm_delay))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(
+        f"{'workers':>8}{'queue':>7}{'threads':>8}{'ok':>6}{'error':>7}{'reject':>7}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>8}"
+        f"{'prompt ms':>10}{'llm ms':>8}{'db ms':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for limit, queue_size, threads in itertools.product(concurrency, max_queue, max_threads):
+            env = dict(
+                os.environ,
+                GROQ_API_KEY="fake-key",
+                GROQ_BASE_URL=f"http://127.0.0.1:{server.server_address[1]}",
+                TRIP_PLANNER_DB=os.path.join(tmp, f"db_{limit}_{queue_size}_{threads}.json"),
+                TRIP_PLANNER_CONCURRENCY=str(limit),
+                TRIP_PLANNER_MAX_QUEUE=str(queue_size),
+                TRIP_PLANNER_MAX_THREADS=str(threads),
+                GRADIO_SERVER_PORT=str(_free_port()),
+                GRADIO_ANALYTICS_ENABLED="False",
+            )
+            log_path = Path(tmp) / f"app_{limit}_{queue_size}_{threads}.log"
+            process, log_file, url = _launch_app(env, log_path)
+            try:
+                result = _drive(url, users, requests_per_user)
+            finally:
+                process.terminate()
+                process.wait()
+                log_file.close()
+            spans = _mean_spans(log_path.read_text(encoding="utf-8", errors="replace"))
+            print(
+                f"{limit:>8}{queue_size:>7}{threads:>8}{result['ok']:>6}"
+                f"{result['errors']:>7}{result['rejected']:>7}"
+                f"{result['p50'] * 1000:>9.1f}{result['p95'] * 1000:>9.1f}"
+                f"{result['p99'] * 1000:>9.1f}{result['throughput']:>8.1f}"
+                f"{spans.get('prompt', 0):>10.3f}{spans.get('llm', 0):>8.1f}"
+                f"{spans.get('save_to_db', 0):>8.1f}"
+            )
+
+    server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the trip planner queue settings")
+    parser.add_argument("--users", type=int, default=16, help="Concurrent simulated users")
+    parser.add_argument(
+        "--requests-per-user", type=int, default=4, help="Requests each user sends in turn"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 4, 8],
+        help="Queue concurrency limits to compare",
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        nargs="+",
+        default=[64],
+        help="Queue max sizes to compare (0 = unbounded)",
+    )
+    parser.add_argument(
+        "--max-threads",
+        type=int,
+        nargs="+",
+        default=[40],
+        help="Server thread pool sizes to compare",
+    )
+    parser.add_argument(
+        "--llm-delay", type=float, default=0.05, help="Fake Groq response delay in seconds"
+    )
+    args = parser.parse_args()
+    run(
+        args.users,
+        args.requests_per_user,
+        args.concurrency,
+        args.max_queue,
+        args.max_threads,
+        args.llm_delay,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Command-line tools for inspecting packed asset bundles."""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from src.services.asset_bundle import BundleReader
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="List or extract asset bundle entries")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List bundle entries")
+    list_parser.add_argument("bundle", help="Path to the .bundle file")
+
+    extract_parser = subparsers.add_parser("extract", help="Extract bundle entries")
+    extract_parser.add_argument("bundle", help="Path to the .bundle file")
+    extract_parser.add_argument(
+        "names",
+        nargs="*",
+        help="Entries to extract (default: all)",
+    )
+    extract_parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory to write extracted entries to",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    with BundleReader(args.bundle) as reader:
+        if args.command == "list":
+            for name, offset, length in reader.entries():
+                print(f"{name}\t{offset}\t{length}")
+            return
+        for name in args.names or reader.names():
+            path = reader.extract(name, str(Path(args.output_dir) / Path(name).name))
+            print(f"Extracted: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -39,20 +39,44 @@ def parse_args() -> argparse.Namespace:
         default="output",
         help="Directory to place generated assets",
     )
+    parser.add_argument(
+        "--target",
+        action="append",
+        dest="targets",
+        help="Export target as FORMAT[:RESOLUTION] (e.g., webm:720p); repeat for more",
+    )
+    parser.add_argument(
+        "--bundle-assets",
+        action="store_true",
+        dest="bundle_assets",
+        help="Pack scene assets into a single images/assets.bundle file",
+    )
+    parser.add_argument(
+        "--draft",
+        action="store_true",
+        help="Render a fast proxy preview; upgrade later with src.upgrade_cli",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    pipeline = Pipeline(output_dir=args.output_dir)
+    pipeline = Pipeline(output_dir=args.output_dir, bundle_assets=args.bundle_assets)
     final_path = pipeline.run(
         title=args.title,
         resolution=args.resolution,
         duration=args.duration,
         video_type=args.video_type,
         defaults_path=args.defaults_path,
+        export_targets=args.targets,
+        draft=args.draft,
     )
-    print(f"Video generated at: {final_path}")
+    report = pipeline.last_export_report
+    if report and len(report.results) > 1:
+        for result in report.results:
+            print(f"Video generated at: {result.path} ({result.seconds:.3f}s)")
+    else:
+        print(f"Video generated at: {final_path}")
 
 
 if __name__ == "__main__":
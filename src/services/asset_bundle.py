@@ -0,0 +1,173 @@
+"""Packed asset bundles: many scene assets in one container file.
+
+Layout::
+
+    MAGIC | entry bytes ... | JSON index | footer (index offset, MAGIC)
+
+The index maps entry names to ``[offset, length]`` pairs. Readers map the
+file with ``mmap`` and hand out ``memoryview`` slices, so entries are never
+copied out of the page cache. Assets inside a bundle are referenced as
+``<bundle path>#<entry name>``; bundle files always use the ``.bundle``
+suffix so references can be recognised by syntax alone.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+MAGIC = b"APBNDL01"
+BUNDLE_SUFFIX = ".bundle"
+_FOOTER = struct.Struct("<Q8s")
+_REF_SEPARATOR = "#"
+
+
+class BundleError(ValueError):
+    """Raised when a bundle file is malformed or an entry is missing."""
+
+
+def make_ref(bundle_path: str, name: str) -> str:
+    return f"{bundle_path}{_REF_SEPARATOR}{name}"
+
+
+def split_ref(ref: str) -> Tuple[str, Optional[str]]:
+    """Split an asset reference into ``(path, entry)``; entry is None for plain files."""
+    path, sep, name = str(ref).rpartition(_REF_SEPARATOR)
+    if sep and path.endswith(BUNDLE_SUFFIX):
+        return path, name
+    return str(ref), None
+
+
+class BundleWriter:
+    """Append assets to a single container file and write its index on close."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        if self.path.suffix != BUNDLE_SUFFIX:
+            raise BundleError(f"Bundle path '{self.path}' must end with '{BUNDLE_SUFFIX}'.")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._index: Dict[str, List[int]] = {}
+        self._file = self.path.open("wb")
+        self._file.write(MAGIC)
+
+    def add(self, name: str, data: bytes) -> str:
+        if name in self._index:
+            raise BundleError(f"Duplicate bundle entry '{name}'.")
+        offset = self._file.tell()
+        self._file.write(data)
+        self._index[name] = [offset, len(data)]
+        return make_ref(str(self.path), name)
+
+    def abort(self) -> None:
+        """Discard a partially written bundle instead of indexing it."""
+        if not self._file.closed:
+            self._file.close()
+        self.path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(json.dumps(self._index).encode("utf-8"))
+        self._file.write(_FOOTER.pack(index_offset, MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> "BundleWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if exc[0] is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class BundleReader:
+    """Zero-copy access to bundle entries through a read-only memory map.
+
+    Views returned by :meth:`get` must be released before :meth:`close`.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise BundleError(f"Bundle '{self.path}' not found.")
+        with self.path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size < len(MAGIC) + _FOOTER.size:
+                raise BundleError(f"'{self.path}' is not an asset bundle.")
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._index = self._read_index()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _read_index(self) -> Dict[str, List[int]]:
+        size = len(self._mmap)
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            raise BundleError(f"'{self.path}' is not an asset bundle.")
+        index_offset, magic = _FOOTER.unpack_from(self._mmap, size - _FOOTER.size)
+        if magic != MAGIC or not len(MAGIC) <= index_offset <= size - _FOOTER.size:
+            raise BundleError(f"'{self.path}' has a corrupt footer.")
+        raw_index = self._mmap[index_offset : size - _FOOTER.size]
+        try:
+            index = json.loads(raw_index.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise BundleError(f"'{self.path}' has a corrupt index.")
+        if not isinstance(index, dict):
+            raise BundleError(f"'{self.path}' has a corrupt index.")
+        for name, entry in index.items():
+            valid = (
+                isinstance(entry, list)
+                and len(entry) == 2
+                and all(isinstance(value, int) and value >= 0 for value in entry)
+                and len(MAGIC) <= entry[0]
+                and entry[0] + entry[1] <= index_offset
+            )
+            if not valid:
+                raise BundleError(f"'{self.path}' has an invalid index entry for '{name}'.")
+        return index
+
+    def names(self) -> List[str]:
+        return list(self._index)
+
+    def entries(self) -> List[Tuple[str, int, int]]:
+        return [(name, offset, length) for name, (offset, length) in self._index.items()]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def get(self, name: str) -> memoryview:
+        if name not in self._index:
+            raise BundleError(f"Entry '{name}' not found in '{self.path}'.")
+        offset, length = self._index[name]
+        return memoryview(self._mmap)[offset : offset + length]
+
+    def extract(self, name: str, destination: str) -> str:
+        target = Path(destination)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self.get(name) as view:
+            target.write_bytes(view)
+        return str(target)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "BundleReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+__all__ = [
+    "BUNDLE_SUFFIX",
+    "BundleError",
+    "BundleReader",
+    "BundleWriter",
+    "make_ref",
+    "split_ref",
+]
@@ -1,25 +1,78 @@
 """Finalize export by merging timeline and audio placeholders."""
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import List, Optional, Sequence
+
+from src.utils.validation import ExportTarget
+
+
+@dataclass
+class ExportResult:
+    target: ExportTarget
+    path: str
+    seconds: float
+
+
+@dataclass
+class ExportReport:
+    results: List[ExportResult] = field(default_factory=list)
+    total_seconds: float = 0.0
+
+    @property
+    def paths(self) -> List[str]:
+        return [result.path for result in self.results]
 
 
 class Exporter:
-    """Write a placeholder final media file."""
+    """Write placeholder final media files."""
 
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, max_workers: Optional[int] = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+
+    def export_targets(
+        self, timeline_path: str, audio_path: str, targets: Sequence[ExportTarget]
+    ) -> ExportReport:
+        """Export every target in one pass.
 
-    def export(self, timeline_path: str, audio_path: str, output_format: str = "mp4") -> str:
-        final_path = self.output_dir / f"final_output.{output_format}"
+        The timeline and audio are read once and shared by all encoders, which
+        run concurrently. A single target keeps the ``final_output.{format}``
+        name; multiple targets are suffixed with their resolution label.
+        """
+        started = time.perf_counter()
         timeline_content = Path(timeline_path).read_text(encoding="utf-8")
         audio_content = Path(audio_path).read_text(encoding="utf-8")
-        final_content = (
-            "--- Timeline ---\n" + timeline_content + "\n\n--- Audio ---\n" + audio_content
-        )
-        final_path.write_text(final_content, encoding="utf-8")
-        return str(final_path)
+        single = len(targets) == 1
+
+        def encode(target: ExportTarget) -> ExportResult:
+            target_started = time.perf_counter()
+            stem = "final_output" if single else f"final_output_{target.resolution.label}"
+            final_path = self.output_dir / f"{stem}.{target.output_format}"
+            final_content = (
+                f"--- Target ---\n{target.resolution.label} "
+                f"({target.resolution.width}x{target.resolution.height}) "
+                f"{target.output_format}\n\n"
+                "--- Timeline ---\n" + timeline_content + "\n\n--- Audio ---\n" + audio_content
+            )
+            final_path.write_text(final_content, encoding="utf-8")
+            return ExportResult(
+                target=target,
+                path=str(final_path),
+                seconds=time.perf_counter() - target_started,
+            )
+
+        report = ExportReport()
+        if targets:
+            workers = self.max_workers or len(targets)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                report.results = list(executor.map(encode, targets))
+        report.total_seconds = time.perf_counter() - started
+        return report
 
 
-__all__ = ["Exporter"]
+__all__ = ["ExportReport", "ExportResult", "Exporter"]
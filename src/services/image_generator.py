@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from typing import Dict, Iterable, List
 
+from .asset_bundle import BundleWriter
 from .scene_planner import Scene
 
 
@@ -12,26 +13,47 @@ class ImageGenerator:
     """Create placeholder images for each scene.
 
     In a production setting this would call an AI image generator. For now,
-    it writes simple text files that represent generated assets.
+    it writes simple text files that represent generated assets. With
+    ``bundle=True`` all scene assets are appended to a single
+    ``images/assets.bundle`` container and the map holds ``bundle#entry`` refs.
+    ``draft=True`` selects the cheap proxy backend used for preview renders.
     """
 
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, bundle: bool = False, draft: bool = False):
         self.output_dir = Path(output_dir)
         self.images_dir = self.output_dir / "images"
         self.images_dir.mkdir(parents=True, exist_ok=True)
+        self.bundle = bundle
+        self.bundle_path = self.images_dir / "assets.bundle"
+        self.draft = draft
+
+    def _render(self, scene: Scene) -> str:
+        if self.draft:
+            return f"Proxy image for scene {scene.index}: {scene.visuals}"
+        return (
+            f"Image placeholder for scene {scene.index}:\n"
+            f"Visuals: {scene.visuals}\n"
+            f"Timing: {scene.start_time}-{scene.end_time}"
+        )
 
     def generate(self, scenes: Iterable[Scene]) -> Dict[int, str]:
+        if self.bundle:
+            return self._generate_bundle(scenes)
         image_map: Dict[int, str] = {}
         for scene in scenes:
             filename = self.images_dir / f"scene_{scene.index}.txt"
-            content = (
-                f"Image placeholder for scene {scene.index}:\n"
-                f"Visuals: {scene.visuals}\n"
-                f"Timing: {scene.start_time}-{scene.end_time}"
-            )
-            filename.write_text(content, encoding="utf-8")
+            filename.write_text(self._render(scene), encoding="utf-8")
             image_map[scene.index] = str(filename)
         return image_map
 
+    def _generate_bundle(self, scenes: Iterable[Scene]) -> Dict[int, str]:
+        image_map: Dict[int, str] = {}
+        with BundleWriter(str(self.bundle_path)) as writer:
+            for scene in scenes:
+                image_map[scene.index] = writer.add(
+                    f"scene_{scene.index}.txt", self._render(scene).encode("utf-8")
+                )
+        return image_map
+
 
 __all__ = ["ImageGenerator"]
@@ -1,34 +1,54 @@
 """Pipeline orchestrator to tie together the generation steps."""
 from __future__ import annotations
 
+import json
 import logging
+from dataclasses import asdict
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
-from src.services.exporter import Exporter
+from src.services.exporter import ExportReport, Exporter
 from src.services.image_generator import ImageGenerator
-from src.services.scene_planner import ScenePlanner
-from src.services.script_generator import ScriptGenerator
+from src.services.scene_planner import Scene, ScenePlanner
+from src.services.script_generator import ScriptGenerator, ScriptSection
 from src.services.video_assembler import VideoAssembler
 from src.services.voice_over import VoiceOverGenerator
-from src.utils.validation import Metadata, ValidationError, validate_and_normalize_metadata
+from src.utils.validation import (
+    ExportTarget,
+    Metadata,
+    ValidationError,
+    resolve_draft_resolution,
+    validate_and_normalize_metadata,
+)
 
 logger = logging.getLogger(__name__)
 
+PLAN_FILENAME = "plan.json"
+DRAFT_DIRNAME = "draft"
+
 
 class Pipeline:
-    """Builds a simple video using stubbed components."""
+    """Builds a simple video using stubbed components.
+
+    Every run saves its script and scene plan to ``plan.json``. A draft run
+    renders a proxy preview under ``draft/`` with cheap stage backends;
+    :meth:`upgrade` later re-renders that approved plan at full quality with
+    the asset layout recorded in the plan.
+    """
 
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", bundle_assets: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.bundle_assets = bundle_assets
+        self.plan_path = self.output_dir / PLAN_FILENAME
 
         self.script_generator = ScriptGenerator()
         self.scene_planner = ScenePlanner()
-        self.image_generator = ImageGenerator(output_dir)
+        self.image_generator = ImageGenerator(output_dir, bundle=bundle_assets)
         self.voice_over_generator = VoiceOverGenerator(output_dir)
         self.video_assembler = VideoAssembler(output_dir)
         self.exporter = Exporter(output_dir)
+        self.last_export_report: Optional[ExportReport] = None
 
     def run(
         self,
@@ -37,14 +57,18 @@ class Pipeline:
         duration: float,
         video_type: str,
         defaults_path: Optional[str] = None,
+        export_targets: Optional[Sequence[str]] = None,
+        draft: bool = False,
     ) -> str:
+        defaults_path = defaults_path or "config/defaults.yaml"
         logger.info("Validating metadata")
         metadata: Metadata = validate_and_normalize_metadata(
             title=title,
             resolution=resolution,
             duration=duration,
             video_type=video_type,
-            defaults_path=defaults_path or "config/defaults.yaml",
+            defaults_path=defaults_path,
+            export_targets=export_targets,
         )
 
         logger.info("Generating script")
@@ -52,24 +76,131 @@ class Pipeline:
 
         logger.info("Planning scenes")
         scenes = self.scene_planner.plan(sections, total_duration=metadata.duration_seconds)
+        self._save_plan(metadata, sections, scenes)
+
+        if draft:
+            return self._render_draft(metadata, scenes, defaults_path)
+        return self._render(
+            metadata.resolution.label,
+            metadata.export_targets,
+            scenes,
+            self.image_generator,
+            self.voice_over_generator,
+            self.video_assembler,
+            self.exporter,
+        )
+
+    def upgrade(self, defaults_path: Optional[str] = None) -> str:
+        """Re-render the saved plan at full quality without regenerating it."""
+        if not self.plan_path.exists():
+            raise FileNotFoundError(
+                f"No saved plan found at '{self.plan_path}'. Run a draft first."
+            )
+        plan = self.load_plan()
+
+        logger.info("Validating saved metadata")
+        saved = plan["metadata"]
+        metadata = validate_and_normalize_metadata(
+            title=saved["title"],
+            resolution=saved["resolution"],
+            duration=saved["duration_seconds"],
+            video_type=saved["video_type"],
+            defaults_path=defaults_path or "config/defaults.yaml",
+            export_targets=saved["export_targets"],
+        )
 
+        image_generator = self.image_generator
+        bundle_assets = plan.get("bundle_assets", False)
+        if bundle_assets != self.bundle_assets:
+            logger.info("Using asset layout from saved plan (bundle_assets=%s)", bundle_assets)
+            image_generator = ImageGenerator(str(self.output_dir), bundle=bundle_assets)
+
+        logger.info("Reusing approved script and scene plan")
+        return self._render(
+            metadata.resolution.label,
+            metadata.export_targets,
+            plan["scenes"],
+            image_generator,
+            self.voice_over_generator,
+            self.video_assembler,
+            self.exporter,
+        )
+
+    def load_plan(self) -> Dict:
+        """Return the saved plan with script sections and scenes rebuilt."""
+        plan = json.loads(self.plan_path.read_text(encoding="utf-8"))
+        plan["sections"] = [ScriptSection(**section) for section in plan["sections"]]
+        plan["scenes"] = [Scene(**scene) for scene in plan["scenes"]]
+        return plan
+
+    def _save_plan(
+        self, metadata: Metadata, sections: List[ScriptSection], scenes: List[Scene]
+    ) -> None:
+        plan = {
+            "metadata": {
+                "title": metadata.title,
+                "resolution": metadata.resolution.label,
+                "duration_seconds": metadata.duration_seconds,
+                "video_type": metadata.video_type,
+                "export_targets": [
+                    f"{target.output_format}:{target.resolution.label}"
+                    for target in metadata.export_targets
+                ],
+            },
+            "bundle_assets": self.bundle_assets,
+            "sections": [asdict(section) for section in sections],
+            "scenes": [asdict(scene) for scene in scenes],
+        }
+        self.plan_path.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+
+    def _render_draft(self, metadata: Metadata, scenes: List[Scene], defaults_path: str) -> str:
+        proxy = resolve_draft_resolution(metadata.resolution, defaults_path)
+        output_format = metadata.export_targets[0].output_format
+        draft_dir = str(self.output_dir / DRAFT_DIRNAME)
+        logger.info("Rendering draft at proxy resolution %s", proxy.label)
+        return self._render(
+            proxy.label,
+            [ExportTarget(output_format=output_format, resolution=proxy)],
+            scenes,
+            ImageGenerator(draft_dir, bundle=self.bundle_assets, draft=True),
+            VoiceOverGenerator(draft_dir, draft=True),
+            VideoAssembler(draft_dir),
+            Exporter(draft_dir),
+        )
+
+    def _render(
+        self,
+        resolution_label: str,
+        targets: Sequence[ExportTarget],
+        scenes: List[Scene],
+        image_generator: ImageGenerator,
+        voice_over_generator: VoiceOverGenerator,
+        video_assembler: VideoAssembler,
+        exporter: Exporter,
+    ) -> str:
         logger.info("Generating images")
-        images = self.image_generator.generate(scenes)
+        images = image_generator.generate(scenes)
 
         logger.info("Generating voice-over")
-        audio_path = self.voice_over_generator.synthesize(scenes)
+        audio_path = voice_over_generator.synthesize(scenes)
 
         logger.info("Assembling video timeline")
-        timeline_path = self.video_assembler.assemble(
-            scenes=scenes, images=images, resolution_label=metadata.resolution.label
+        timeline_path = video_assembler.assemble(
+            scenes=scenes, images=images, resolution_label=resolution_label
         )
 
         logger.info("Exporting final media")
-        final_path = self.exporter.export(
+        report = exporter.export_targets(
             timeline_path=timeline_path,
             audio_path=audio_path,
-            output_format=metadata.output_format,
+            targets=targets,
         )
+        self.last_export_report = report
+        for result in report.results:
+            logger.info(
+                "Exported %s in %.3fs: %s", result.target.label, result.seconds, result.path
+            )
+        final_path = report.results[0].path
 
         logger.info("Pipeline completed: %s", final_path)
         return final_path
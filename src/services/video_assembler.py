@@ -1,9 +1,11 @@
 """Assemble scenes and images into a timeline placeholder."""
 from __future__ import annotations
 
+import zlib
 from pathlib import Path
 from typing import Dict, Iterable
 
+from .asset_bundle import BundleReader, split_ref
 from .scene_planner import Scene
 
 
@@ -17,9 +19,12 @@ class VideoAssembler:
 
     def assemble(self, scenes: Iterable[Scene], images: Dict[int, str], resolution_label: str) -> str:
         timeline_file = self.video_dir / "timeline.txt"
+        checksums = self._read_images(images)
         lines = [f"Resolution: {resolution_label}"]
         for scene in scenes:
             image_path = images.get(scene.index, "unknown")
+            if scene.index in checksums:
+                image_path = f"{image_path} (crc32 {checksums[scene.index]:08x})"
             lines.append(
                 f"Scene {scene.index} [{scene.start_time}-{scene.end_time}] | "
                 f"Image: {image_path} | Narration: {scene.narration}"
@@ -27,5 +32,28 @@ class VideoAssembler:
         timeline_file.write_text("\n".join(lines), encoding="utf-8")
         return str(timeline_file)
 
+    @staticmethod
+    def _read_images(images: Dict[int, str]) -> Dict[int, int]:
+        """Read bundled image assets and return their CRC32 by scene index.
+
+        Bundle entries are read in place through the bundle's memory map,
+        opening each bundle once. Plain per-file images are left untouched.
+        """
+        checksums: Dict[int, int] = {}
+        readers: Dict[str, BundleReader] = {}
+        try:
+            for index, ref in images.items():
+                path, name = split_ref(ref)
+                if name is None:
+                    continue
+                if path not in readers:
+                    readers[path] = BundleReader(path)
+                with readers[path].get(name) as view:
+                    checksums[index] = zlib.crc32(view)
+        finally:
+            for reader in readers.values():
+                reader.close()
+        return checksums
+
 
 __all__ = ["VideoAssembler"]
@@ -8,18 +8,23 @@ from .scene_planner import Scene
 
 
 class VoiceOverGenerator:
-    """Generate placeholder voice-over audio for scenes."""
+    """Generate placeholder voice-over audio for scenes.
 
-    def __init__(self, output_dir: str):
+    ``draft=True`` selects a cheap scratch-voice backend for preview renders.
+    """
+
+    def __init__(self, output_dir: str, draft: bool = False):
         self.output_dir = Path(output_dir)
         self.audio_dir = self.output_dir / "audio"
         self.audio_dir.mkdir(parents=True, exist_ok=True)
+        self.draft = draft
 
     def synthesize(self, scenes: Iterable[Scene]) -> str:
         audio_file = self.audio_dir / "voice_over.txt"
         lines = []
         for scene in scenes:
-            lines.append(f"Scene {scene.index}: {scene.narration}")
+            voice = " [scratch voice]" if self.draft else ""
+            lines.append(f"Scene {scene.index}{voice}: {scene.narration}")
         audio_file.write_text("\n".join(lines), encoding="utf-8")
         return str(audio_file)
 
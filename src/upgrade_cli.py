@@ -0,0 +1,41 @@
+"""Command-line entrypoint to upgrade an approved draft to full quality."""
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+
+from src.services.pipeline import PLAN_FILENAME, Pipeline
+
+logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Re-render a saved draft plan at full quality"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="output",
+        help="Directory holding the draft run and its plan.json",
+    )
+    parser.add_argument(
+        "--defaults-path",
+        default="config/defaults.yaml",
+        help="Path to YAML defaults for validation",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    plan_path = Path(args.output_dir) / PLAN_FILENAME
+    if not plan_path.is_file():
+        raise SystemExit(f"No saved plan found at '{plan_path}'. Run a draft first.")
+    pipeline = Pipeline(output_dir=args.output_dir)
+    final_path = pipeline.upgrade(defaults_path=args.defaults_path)
+    print(f"Video generated at: {final_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,9 @@ values are within expected bounds.
 from __future__ import annotations
 
 import importlib.util
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 _DEFAULTS_PATH = "config/defaults.yaml"
 _YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
@@ -28,6 +28,16 @@ class Resolution:
         return self.width, self.height
 
 
+@dataclass
+class ExportTarget:
+    output_format: str
+    resolution: Resolution
+
+    @property
+    def label(self) -> str:
+        return f"{self.resolution.label}_{self.output_format}"
+
+
 @dataclass
 class Metadata:
     title: str
@@ -35,6 +45,7 @@ class Metadata:
     duration_seconds: int
     video_type: str
     output_format: str
+    export_targets: List[ExportTarget] = field(default_factory=list)
 
 
 class ValidationError(ValueError):
@@ -51,6 +62,7 @@ DEFAULTS = {
     "min_duration_seconds": 30,
     "max_duration_seconds": 3600,
     "output_format": "mp4",
+    "supported_output_formats": ("mp4", "webm", "mov"),
 }
 
 
@@ -83,7 +95,7 @@ def _parse_defaults_without_yaml(text: str) -> Dict:
                 current_section = key
                 if key == "allowed_resolutions":
                     data[key] = {}
-                elif key == "supported_video_types":
+                else:
                     data[key] = []
         elif indent == 2 and current_section == "allowed_resolutions":
             current_resolution = line.rstrip(":")
@@ -91,7 +103,7 @@ def _parse_defaults_without_yaml(text: str) -> Dict:
         elif indent == 4 and current_section == "allowed_resolutions" and current_resolution:
             key, _, value = line.partition(":")
             data[current_section][current_resolution][key] = _parse_scalar(value)
-        elif indent >= 2 and current_section == "supported_video_types" and line.startswith("- "):
+        elif indent >= 2 and current_section and line.startswith("- "):
             data[current_section].append(line[2:].strip())
 
     return data
@@ -141,12 +153,44 @@ def _normalize_duration(duration: float, min_seconds: int, max_seconds: int) ->
     return seconds
 
 
+def _normalize_export_targets(
+    specs: Sequence[str],
+    default_resolution: Resolution,
+    allowed_resolutions: Dict[str, Dict[str, int]],
+    allowed_formats: Tuple[str, ...],
+) -> List[ExportTarget]:
+    targets: List[ExportTarget] = []
+    seen = set()
+    for spec in specs:
+        output_format, _, resolution = str(spec).strip().partition(":")
+        output_format = output_format.strip().lower()
+        if not output_format:
+            raise ValidationError(f"Export target '{spec}' is missing an output format.")
+        if output_format not in allowed_formats:
+            raise ValidationError(
+                f"Unsupported output format '{output_format}'. "
+                f"Allowed: {', '.join(sorted(allowed_formats))}."
+            )
+        target_resolution = (
+            _normalize_resolution(resolution.strip(), allowed_resolutions)
+            if resolution.strip()
+            else default_resolution
+        )
+        target = ExportTarget(output_format=output_format, resolution=target_resolution)
+        if target.label in seen:
+            raise ValidationError(f"Duplicate export target '{spec}'.")
+        seen.add(target.label)
+        targets.append(target)
+    return targets
+
+
 def validate_and_normalize_metadata(
     title: str,
     resolution: str,
     duration: float,
     video_type: str,
     defaults_path: str = _DEFAULTS_PATH,
+    export_targets: Optional[Sequence[str]] = None,
 ) -> Metadata:
     """Validate and normalize user-supplied metadata.
 
@@ -156,6 +200,9 @@ def validate_and_normalize_metadata(
         duration: Duration in seconds (numeric).
         video_type: A supported video type.
         defaults_path: Optional path to YAML defaults for customization.
+        export_targets: Optional ``format[:resolution]`` specs (e.g. ``webm:720p``)
+            to export in a single run. Defaults to the configured output format
+            at the requested resolution.
 
     Returns:
         Metadata: Normalized metadata object.
@@ -172,10 +219,20 @@ def validate_and_normalize_metadata(
     min_duration = int(defaults.get("min_duration_seconds", DEFAULTS["min_duration_seconds"]))
     max_duration = int(defaults.get("max_duration_seconds", DEFAULTS["max_duration_seconds"]))
     output_format = str(defaults.get("output_format", DEFAULTS["output_format"])).lower()
+    supported_formats = tuple(
+        str(fmt).lower()
+        for fmt in defaults.get("supported_output_formats", DEFAULTS["supported_output_formats"])
+    )
 
     normalized_resolution = _normalize_resolution(resolution, allowed_resolutions)
     normalized_type = _normalize_video_type(video_type, supported_types)
     normalized_duration = _normalize_duration(duration, min_duration, max_duration)
+    normalized_targets = _normalize_export_targets(
+        export_targets or [output_format],
+        normalized_resolution,
+        allowed_resolutions,
+        tuple(dict.fromkeys(supported_formats + (output_format,))),
+    )
 
     return Metadata(
         title=str(title).strip(),
@@ -183,12 +240,44 @@ def validate_and_normalize_metadata(
         duration_seconds=normalized_duration,
         video_type=normalized_type,
         output_format=output_format,
+        export_targets=normalized_targets,
     )
 
 
+def resolve_draft_resolution(
+    requested: Resolution, defaults_path: str = _DEFAULTS_PATH
+) -> Resolution:
+    """Return the proxy resolution for a draft render of ``requested``.
+
+    Uses ``draft_resolution`` from the defaults, or the smallest allowed
+    resolution when unset, and never exceeds the requested resolution.
+
+    Raises:
+        ValidationError: If the configured draft resolution is not allowed.
+    """
+    defaults = _load_defaults(defaults_path)
+    allowed = defaults.get("allowed_resolutions", {})
+    configured = defaults.get("draft_resolution")
+    if configured:
+        proxy = _normalize_resolution(configured, allowed)
+    elif allowed:
+        smallest = min(
+            allowed, key=lambda key: int(allowed[key]["width"]) * int(allowed[key]["height"])
+        )
+        proxy = _normalize_resolution(smallest, allowed)
+    else:
+        return requested
+
+    if proxy.width * proxy.height > requested.width * requested.height:
+        return requested
+    return proxy
+
+
 __all__ = [
+    "ExportTarget",
     "Metadata",
     "Resolution",
     "ValidationError",
+    "resolve_draft_resolution",
     "validate_and_normalize_metadata",
 ]
@@ -0,0 +1,68 @@
+import pytest
+
+from src.services.asset_bundle import BundleError, BundleReader, BundleWriter, split_ref
+
+
+def test_bundle_round_trip(tmp_path):
+    bundle_path = tmp_path / "assets.bundle"
+    with BundleWriter(str(bundle_path)) as writer:
+        first_ref = writer.add("scene_1.txt", b"first")
+        writer.add("scene_2.txt", b"second")
+
+    path, name = split_ref(first_ref)
+    with BundleReader(path) as reader:
+        assert reader.names() == ["scene_1.txt", "scene_2.txt"]
+        with reader.get(name) as view:
+            assert bytes(view) == b"first"
+        extracted = reader.extract("scene_2.txt", str(tmp_path / "out" / "scene_2.txt"))
+        with pytest.raises(BundleError):
+            reader.get("missing.txt")
+
+    assert (tmp_path / "out" / "scene_2.txt").read_bytes() == b"second"
+    assert extracted.endswith("scene_2.txt")
+
+
+def test_split_ref_uses_syntax_only(tmp_path):
+    missing = tmp_path / "gone.bundle"
+
+    assert split_ref(f"{missing}#scene_1.txt") == (str(missing), "scene_1.txt")
+    assert split_ref("images/scene#1.txt") == ("images/scene#1.txt", None)
+    with pytest.raises(BundleError):
+        BundleReader(str(missing))
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"",
+        b"not a bundle at all, just some bytes",
+        b"APBNDL01{not json" + b"\x08\x00\x00\x00\x00\x00\x00\x00APBNDL01",
+    ],
+)
+def test_bundle_reader_rejects_non_bundle(tmp_path, payload):
+    path = tmp_path / "plain.bundle"
+    path.write_bytes(payload)
+
+    with pytest.raises(BundleError):
+        BundleReader(str(path))
+
+
+def test_bundle_reader_rejects_out_of_range_entry(tmp_path):
+    path = tmp_path / "bad.bundle"
+    with BundleWriter(str(path)) as writer:
+        writer.add("a", b"hello")
+    data = path.read_bytes().replace(b'"a": [8, 5]', b'"a": [8, 9999]')
+    path.write_bytes(data)
+
+    with pytest.raises(BundleError):
+        BundleReader(str(path))
+
+
+def test_bundle_writer_discards_bundle_on_error(tmp_path):
+    path = tmp_path / "partial.bundle"
+    with pytest.raises(RuntimeError):
+        with BundleWriter(str(path)) as writer:
+            writer.add("a", b"hello")
+            raise RuntimeError("generation failed")
+
+    assert not path.exists()
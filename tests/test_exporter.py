@@ -0,0 +1,47 @@
+from pathlib import Path
+
+from src.services.exporter import Exporter
+from src.utils.validation import ExportTarget, Resolution
+
+
+def _write_inputs(tmp_path):
+    timeline = tmp_path / "timeline.txt"
+    audio = tmp_path / "audio.txt"
+    timeline.write_text("Resolution: 1080p", encoding="utf-8")
+    audio.write_text("Scene 1: hello", encoding="utf-8")
+    return str(timeline), str(audio)
+
+
+def test_export_targets_fans_out_in_one_pass(tmp_path):
+    timeline, audio = _write_inputs(tmp_path)
+    exporter = Exporter(str(tmp_path / "output"))
+    targets = [
+        ExportTarget("mp4", Resolution("1080p", 1920, 1080)),
+        ExportTarget("webm", Resolution("1080p", 1920, 1080)),
+        ExportTarget("mp4", Resolution("720p", 1280, 720)),
+    ]
+
+    report = exporter.export_targets(timeline, audio, targets)
+
+    assert [Path(path).name for path in report.paths] == [
+        "final_output_1080p.mp4",
+        "final_output_1080p.webm",
+        "final_output_720p.mp4",
+    ]
+    for result in report.results:
+        content = Path(result.path).read_text(encoding="utf-8")
+        assert "Timeline" in content and "Audio" in content
+        assert result.target.resolution.label in content
+        assert result.seconds >= 0
+    assert report.total_seconds >= max(result.seconds for result in report.results)
+
+
+def test_export_single_target_keeps_final_output_name(tmp_path):
+    timeline, audio = _write_inputs(tmp_path)
+    exporter = Exporter(str(tmp_path / "output"))
+
+    report = exporter.export_targets(
+        timeline, audio, [ExportTarget("mp4", Resolution("1080p", 1920, 1080))]
+    )
+
+    assert Path(report.paths[0]).name == "final_output.mp4"
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from src.services.pipeline import Pipeline
 
 
@@ -19,3 +21,92 @@ def test_pipeline_creates_output(tmp_path):
     content = Path(final_path).read_text(encoding="utf-8")
     assert "Timeline" in content
     assert "Audio" in content
+    assert "crc32" not in content
+
+
+def test_pipeline_bundles_scene_assets(tmp_path):
+    output_dir = tmp_path / "output"
+    pipeline = Pipeline(output_dir=str(output_dir), bundle_assets=True)
+
+    final_path = pipeline.run(
+        title="Sample",
+        resolution="720p",
+        duration=90,
+        video_type="explainer",
+        defaults_path="config/defaults.yaml",
+    )
+
+    images_dir = output_dir / "images"
+    assert [path.name for path in images_dir.iterdir()] == ["assets.bundle"]
+    content = Path(final_path).read_text(encoding="utf-8")
+    assert "assets.bundle#scene_1.txt (crc32 " in content
+
+
+def test_pipeline_draft_then_upgrade_reuses_plan(tmp_path):
+    output_dir = tmp_path / "output"
+    pipeline = Pipeline(output_dir=str(output_dir))
+
+    draft_path = pipeline.run(
+        title="Sample",
+        resolution="4k",
+        duration=90,
+        video_type="explainer",
+        defaults_path="config/defaults.yaml",
+        draft=True,
+    )
+
+    assert Path(draft_path).parent == output_dir / "draft"
+    assert "Resolution: 720p" in Path(draft_path).read_text(encoding="utf-8")
+
+    plan_path = output_dir / "plan.json"
+    plan_text = plan_path.read_text(encoding="utf-8").replace("Sample", "Approved")
+    plan_path.write_text(plan_text, encoding="utf-8")
+
+    final_path = Pipeline(output_dir=str(output_dir)).upgrade(
+        defaults_path="config/defaults.yaml"
+    )
+
+    content = Path(final_path).read_text(encoding="utf-8")
+    assert Path(final_path).parent == output_dir
+    assert "Resolution: 4k" in content
+    assert "Approved" in content
+
+
+def test_pipeline_upgrade_keeps_bundled_layout(tmp_path):
+    output_dir = tmp_path / "output"
+    Pipeline(output_dir=str(output_dir), bundle_assets=True).run(
+        title="Sample",
+        resolution="1080p",
+        duration=90,
+        video_type="explainer",
+        defaults_path="config/defaults.yaml",
+        draft=True,
+    )
+
+    Pipeline(output_dir=str(output_dir)).upgrade(defaults_path="config/defaults.yaml")
+
+    assert [path.name for path in (output_dir / "images").iterdir()] == ["assets.bundle"]
+
+
+def test_pipeline_draft_uses_requested_target_format(tmp_path):
+    output_dir = tmp_path / "output"
+    pipeline = Pipeline(output_dir=str(output_dir))
+
+    draft_path = pipeline.run(
+        title="Sample",
+        resolution="1080p",
+        duration=90,
+        video_type="explainer",
+        defaults_path="config/defaults.yaml",
+        export_targets=["webm"],
+        draft=True,
+    )
+
+    assert Path(draft_path).name == "final_output.webm"
+
+
+def test_pipeline_upgrade_without_plan_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Pipeline(output_dir=str(tmp_path / "output")).upgrade(
+            defaults_path="config/defaults.yaml"
+        )
@@ -0,0 +1,81 @@
+import importlib
+import json
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("gradio")
+pytest.importorskip("groq")
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setenv("TRIP_PLANNER_DB", str(tmp_path / "database.json"))
+    sys.modules.pop("app", None)
+    module = importlib.import_module("app")
+    yield module
+    sys.modules.pop("app", None)
+
+
+def _stub_client(content):
+    create = lambda **kwargs: SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def test_plan_trip_timed_records_phase_spans(app, monkeypatch):
+    monkeypatch.setattr(app, "client", _stub_client("Day 1: Badshahi Mosque"))
+
+    plan, spans, outcome = app.plan_trip_timed("Lahore", "2", "50000")
+
+    assert plan == "Day 1: Badshahi Mosque"
+    assert outcome == "ok"
+    assert set(spans) == {"prompt", "llm", "save_to_db"}
+    assert all(seconds >= 0 for seconds in spans.values())
+
+
+def test_plan_trip_timed_records_failed_llm_span(app, monkeypatch):
+    def fail(**kwargs):
+        raise RuntimeError("rate limited")
+
+    failing = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=fail)))
+    monkeypatch.setattr(app, "client", failing)
+
+    plan, spans, outcome = app.plan_trip_timed("Lahore", "2", "50000")
+
+    assert plan.startswith("❌ Error")
+    assert outcome == "llm_error"
+    assert set(spans) == {"prompt", "llm"}
+    assert app.plan_trip_timed("", "2", "50000")[2] == "invalid"
+
+
+def test_save_to_db_concurrent_writes_keep_every_entry(app):
+    threads = [
+        threading.Thread(target=app.save_to_db, args=("Lahore", str(day), "1000", "plan"))
+        for day in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with open(app.DB, encoding="utf-8") as f:
+        entries = json.load(f)
+    assert sorted(int(entry["days"]) for entry in entries) == list(range(20))
+
+
+def test_percentile_uses_nearest_rank():
+    pytest.importorskip("gradio_client")
+    from benchmarks.bench_trip_planner import _percentile
+
+    ten = [float(value) for value in range(1, 11)]
+    twenty = [float(value) for value in range(1, 21)]
+
+    assert _percentile(ten, 50) == 5.0
+    assert _percentile(twenty, 95) == 19.0
+    assert _percentile(twenty, 99) == 20.0
+    assert _percentile([], 50) == 0.0
@@ -1,6 +1,10 @@
 import pytest
 
-from src.utils.validation import ValidationError, validate_and_normalize_metadata
+from src.utils.validation import (
+    ValidationError,
+    resolve_draft_resolution,
+    validate_and_normalize_metadata,
+)
 
 
 def test_validate_and_normalize_metadata_success(tmp_path):
@@ -59,3 +63,89 @@ output_format: mp4
             video_type="promo",
             defaults_path=str(defaults),
         )
+
+
+def test_validate_and_normalize_metadata_export_targets():
+    metadata = validate_and_normalize_metadata(
+        title="Example",
+        resolution="1080p",
+        duration=60,
+        video_type="promo",
+        defaults_path="config/defaults.yaml",
+        export_targets=["mp4", "webm", "mp4:720p"],
+    )
+
+    assert [target.label for target in metadata.export_targets] == [
+        "1080p_mp4",
+        "1080p_webm",
+        "720p_mp4",
+    ]
+
+    with pytest.raises(ValidationError):
+        validate_and_normalize_metadata(
+            title="Example",
+            resolution="1080p",
+            duration=60,
+            video_type="promo",
+            defaults_path="config/defaults.yaml",
+            export_targets=["avi"],
+        )
+
+
+def test_resolve_draft_resolution_is_lazy_and_clamped(tmp_path):
+    defaults = tmp_path / "defaults.yaml"
+    defaults.write_text(
+        """
+allowed_resolutions:
+  720p:
+    width: 1280
+    height: 720
+  1080p:
+    width: 1920
+    height: 1080
+supported_video_types:
+  - promo
+min_duration_seconds: 10
+max_duration_seconds: 120
+output_format: mp4
+draft_resolution: 1080p
+""",
+        encoding="utf-8",
+    )
+
+    metadata = validate_and_normalize_metadata(
+        title="Example",
+        resolution="720p",
+        duration=60,
+        video_type="promo",
+        defaults_path=str(defaults),
+    )
+    assert resolve_draft_resolution(metadata.resolution, str(defaults)).label == "720p"
+
+    text = defaults.read_text(encoding="utf-8")
+    defaults.write_text(text.replace("draft_resolution: 1080p", "draft_resolution: 8k"), encoding="utf-8")
+    validate_and_normalize_metadata(
+        title="Example",
+        resolution="720p",
+        duration=60,
+        video_type="promo",
+        defaults_path=str(defaults),
+    )
+    with pytest.raises(ValidationError):
+        resolve_draft_resolution(metadata.resolution, str(defaults))
+
+
+@pytest.mark.parametrize(
+    "spec, message",
+    [(":720p", "missing an output format"), ("avi", "Allowed: mov, mp4, webm.")],
+)
+def test_validate_and_normalize_metadata_export_target_errors(spec, message):
+    with pytest.raises(ValidationError, match=message):
+        validate_and_normalize_metadata(
+            title="Example",
+            resolution="1080p",
+            duration=60,
+            video_type="promo",
+            defaults_path="config/defaults.yaml",
+            export_targets=[spec],
+        )